@@ -0,0 +1,62 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, cdivision=True
+"""
+_pac_core.pyx
+Optional C build of the per-frame hot paths in game.py: the BFS flood used for
+ghost pathfinding and the fixed-step entity movement. game.py falls back to its
+own Python/numba versions when this module isn't built.
+
+Build: python3 setup.py build_ext --inplace
+"""
+
+from libc.math cimport sqrt
+from libc.stdlib cimport malloc, free
+
+cdef int DR[4]
+cdef int DC[4]
+DR[:] = [-1, 1, 0, 0]
+DC[:] = [0, 0, -1, 1]
+
+def flood(const unsigned char[:, ::1] wall, int gr, int gc, int[::1] parent):
+    """BFS outward from (gr,gc); parent[r*cols+c] = next cell towards the goal, -1 if unreachable."""
+    cdef int rows = wall.shape[0]
+    cdef int cols = wall.shape[1]
+    cdef int size = rows * cols
+    cdef int goal = gr * cols + gc
+    cdef int head = 0, tail = 1
+    cdef int cur, r, c, k, nr, nc, n
+    cdef int *queue = <int *> malloc(size * sizeof(int))
+    if queue == NULL:
+        raise MemoryError()
+    for n in range(size):
+        parent[n] = -1
+    parent[goal] = goal
+    queue[0] = goal
+    while head < tail:
+        cur = queue[head]
+        head += 1
+        r = cur // cols
+        c = cur % cols
+        for k in range(4):
+            nr = r + DR[k]
+            nc = c + DC[k]
+            if nr < 0 or nr >= rows or nc < 0 or nc >= cols or wall[nr, nc]:
+                continue
+            n = nr * cols + nc
+            if parent[n] != -1:
+                continue
+            parent[n] = cur
+            queue[tail] = n
+            tail += 1
+    free(queue)
+
+def step_entity(double px, double py, double tx, double ty, double move_pixels):
+    """Move (px,py) up to move_pixels towards (tx,ty); returns (px, py, arrived)."""
+    cdef double ddx = tx - px
+    cdef double ddy = ty - py
+    cdef double dist = sqrt(ddx * ddx + ddy * ddy)
+    cdef double inv
+    if dist <= move_pixels:
+        # snap to target
+        return tx, ty, True
+    inv = move_pixels / dist
+    return px + ddx * inv, py + ddy * inv, False
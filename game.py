@@ -8,11 +8,26 @@ Features:
 - Score, lives, READY state, Game Over and Restart
 - No external assets required (drawn shapes)
 
-Requirements: pygame (tested with pygame 2.x)
+Requirements: pygame (tested with pygame 2.x), numpy
+Optional: numba (JIT-compiles the ghost pathfinder; plain Python is used without it)
+Optional: Cython core for pathfinding and movement: python3 setup.py build_ext --inplace
 Run: python3 pacman_classic.py
 """
 
 import pygame, sys, random, collections, time, math
+from itertools import compress
+import numpy as np
+
+try:
+    from numba import njit
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+    def njit(*args, **kwargs):
+        # no numba: leave the function as plain Python
+        if args and callable(args[0]):
+            return args[0]
+        return lambda f: f
 
 # --- Config ---
 TILE = 16            # tile size in pixels (classic: 16)
@@ -21,11 +36,15 @@ ROWS = 31
 WIDTH = COLS * TILE
 HEIGHT = ROWS * TILE
 FPS = 60
+DT_FIXED = 1.0 / 120  # simulation step in seconds
+MAX_FRAME_DT = 0.25   # longest frame time simulated; beyond that the game slows down
 
 PLAYER_SPEED = 5.0   # tiles per second (movement in grid steps per second)
 GHOST_SPEED = 4.0    # tiles per second (normal)
 FRIGHT_SPEED = 2.5   # when frightened
 POWER_DURATION = 8.0 # seconds ghosts remain frightened
+FRIGHT_RETARGET = 0.5 # seconds a frightened ghost keeps its wander target
+GHOST_HOME = (13,13)  # ghost box tile eaten ghosts return to
 
 # Colors
 BLACK = (0,0,0)
@@ -90,31 +109,33 @@ MAP = [
 # Some rows have leading spaces in the original text; ensure all rows are 28 chars:
 MAP = [row.ljust(COLS)[:COLS] for row in MAP]
 
-# Helper grid functions
-def in_bounds(r,c):
-    return 0 <= r < ROWS and 0 <= c < COLS
+# The map flattened into one bytes object: MAP_BYTES[r*COLS+c] is the tile's
+# character code as an int. Plain-Python checks use it; WALL_FLAT / WALL are the
+# same walls as a numpy bitmap (WALL is a (ROWS, COLS) view) for numba and numpy.
+# MAP itself is kept for map parsing and debug prints.
+MAP_BYTES = b''.join(row.encode('ascii') for row in MAP)
+WALL_CH = ord('#')
+WALL_FLAT = np.frombuffer(MAP_BYTES, np.uint8) == WALL_CH
+WALL = WALL_FLAT.reshape(ROWS, COLS)
+WALL_U8 = WALL.view(np.uint8)   # same bitmap as bytes, for the Cython core
 
-def is_wall(tile):
-    return tile == '#'
+# tile types for pellets (filled in while parsing the map below)
+TILE_EMPTY = 0
+TILE_PELLET = 1
+TILE_POWER = 2
+TILE_TYPE = np.zeros((ROWS, COLS), dtype=np.int8)
 
-def neighbors(rc):
-    r,c = rc
-    for dr,dc in [(-1,0),(1,0),(0,-1),(0,1)]:
-        nr, nc = r+dr, c+dc
-        if in_bounds(nr,nc) and not is_wall(MAP[nr][nc]):
-            yield (nr,nc)
+DIRS = ((-1,0),(1,0),(0,-1),(0,1))
 
 # Convert to tile grid for pathfinding and initial placements
-pellets = set()
-power_pellets = set()
 player_start = None
 ghost_starts = {}
 for r,row in enumerate(MAP):
     for c,ch in enumerate(row):
         if ch == '.':
-            pellets.add((r,c))
+            TILE_TYPE[r,c] = TILE_PELLET
         elif ch == 'o':
-            power_pellets.add((r,c))
+            TILE_TYPE[r,c] = TILE_POWER
         elif ch == 'P':
             player_start = (r,c)
         elif ch in '1234':
@@ -132,6 +153,13 @@ if not player_start:
                 break
         if player_start: break
 
+# Initial pellet masks (copied into the active masks on start/restart) and the
+# pellet coordinates, so drawing only visits tiles that can hold a pellet
+PELLET_MASK0 = TILE_TYPE == TILE_PELLET
+POWER_MASK0 = TILE_TYPE == TILE_POWER
+PELLET_COORDS = [(int(r), int(c)) for r,c in np.argwhere(PELLET_MASK0)]
+POWER_COORDS = [(int(r), int(c)) for r,c in np.argwhere(POWER_MASK0)]
+
 # Ghost default starts if none provided
 if not ghost_starts:
     ghost_starts = {
@@ -141,41 +169,130 @@ if not ghost_starts:
         '4': (13,15)
     }
 
-# BFS pathfinder on grid (returns list of tile positions from start to goal)
-def bfs(start, goal):
-    if start == goal: return [start]
-    q = collections.deque([start])
-    came = {start: None}
+# BFS pathfinder on grid. Instead of searching start -> goal for every ghost,
+# flood the whole maze outward from the goal once: parent[r*COLS+c] is then the
+# next cell on a shortest path from (r,c) towards the goal (the goal points at
+# itself, -1 means unreachable). Every ghost heading for the same goal shares it.
+def flood(grid, gr, gc, parent):
+    parent[:] = -1
+    goal = gr * COLS + gc
+    parent[goal] = goal
+    q = collections.deque([(gr, gc)])
     while q:
-        cur = q.popleft()
-        for n in neighbors(cur):
-            if n not in came:
-                came[n] = cur
-                if n == goal:
-                    # build path
-                    path = [n]
-                    while cur is not None:
-                        path.append(cur)
-                        cur = came[cur]
-                    return path[::-1]
-                q.append(n)
-    return None
-
-# Convert tile center -> pixel
+        r,c = q.popleft()
+        cur = r * COLS + c
+        for dr,dc in DIRS:
+            nr, nc = r+dr, c+dc
+            if 0 <= nr < ROWS and 0 <= nc < COLS:
+                n = nr * COLS + nc
+                if grid[n] != WALL_CH and parent[n] == -1:
+                    parent[n] = cur
+                    q.append((nr,nc))
+
+# Same flood compiled with numba, with a flat int32 array as the queue
+DR = np.array([-1, 1, 0, 0], dtype=np.int32)
+DC = np.array([0, 0, -1, 1], dtype=np.int32)
+
+@njit(cache=True)
+def flood_nb(wall, gr, gc, parent):
+    rows, cols = wall.shape
+    parent[:] = -1
+    goal = gr * cols + gc
+    parent[goal] = goal
+    queue = np.empty(rows * cols, np.int32)
+    queue[0] = goal
+    head = 0
+    tail = 1
+    while head < tail:
+        cur = queue[head]
+        head += 1
+        r = cur // cols
+        c = cur % cols
+        for k in range(4):
+            nr = r + DR[k]
+            nc = c + DC[k]
+            if nr < 0 or nr >= rows or nc < 0 or nc >= cols or wall[nr, nc]:
+                continue
+            n = nr * cols + nc
+            if parent[n] != -1:
+                continue
+            parent[n] = cur
+            queue[tail] = n
+            tail += 1
+
+# The maze never changes, so a flood stays valid for good; the cache holds at
+# most one per tile (~3.5KB each).
+_floods = {}
+
+def goal_flood(goal):
+    parent = _floods.get(goal)
+    if parent is None:
+        parent = np.empty(ROWS * COLS, np.int32)
+        if HAVE_CORE:
+            flood_c(WALL_U8, goal[0], goal[1], parent)
+        elif HAVE_NUMBA:
+            flood_nb(WALL, goal[0], goal[1], parent)
+        else:
+            flood(MAP_BYTES, goal[0], goal[1], parent)
+        _floods[goal] = parent
+    return parent
+
+def next_step(tile, goal):
+    """Neighbouring tile one step from tile towards goal, or None if there or unreachable."""
+    r,c = tile
+    here = r * COLS + c
+    n = int(goal_flood(goal)[here])
+    if n < 0 or n == here:
+        return None
+    # a goal inside a wall (the scatter corners) still floods its open neighbours
+    if MAP_BYTES[n] == WALL_CH:
+        return None
+    return divmod(n, COLS)
+
+# Tile center -> pixel lookup tables, indexed TILE_CENTER_X[c] / TILE_CENTER_Y[r].
+# Kept as lists so lookups give plain ints rather than numpy scalars.
+TILE_CENTER_X = (np.arange(COLS, dtype=np.int32) * TILE + TILE//2).tolist()
+TILE_CENTER_Y = (np.arange(ROWS, dtype=np.int32) * TILE + TILE//2).tolist()
+
 def tile_center(tile):
     r,c = tile
-    return (c * TILE + TILE//2, r * TILE + TILE//2)
+    return (TILE_CENTER_X[c], TILE_CENTER_Y[r])
 
 # Movement helpers (tile-based movement with sub-tile smoothness)
 def lerp(a,b,t): return a + (b-a)*t
 
+def step_entity(px, py, tx, ty, move_pixels):
+    """Move (px,py) up to move_pixels towards (tx,ty); returns (px, py, arrived)."""
+    ddx = tx - px
+    ddy = ty - py
+    dist = math.hypot(ddx, ddy)
+    if dist <= move_pixels:
+        # snap to target
+        return tx, ty, True
+    inv = move_pixels / dist
+    return px + ddx * inv, py + ddy * inv, False
+
+# C versions of flood() and step_entity(), if the _pac_core extension is built
+try:
+    from _pac_core import flood as flood_c, step_entity
+    HAVE_CORE = True
+except ImportError:
+    HAVE_CORE = False
+
+# Open tiles connected to the player's start, i.e. every tile a ghost can path to.
+# Frightened ghosts pick their wander targets from here; the open space outside
+# the maze walls is left out so a target is never unreachable.
+WALKABLE = [divmod(int(n), COLS) for n in np.flatnonzero(goal_flood(player_start) >= 0)]
+
 # --- Entities ---
 class Player:
+    __slots__ = ('tile', 'px', 'py', 'dx', 'dy', 'ndx', 'ndy', 'radius', 'lives', 'score', 'alive')
+
     def __init__(self, start_tile):
         self.tile = start_tile
-        self.pos = pygame.Vector2(tile_center(start_tile))
-        self.dir = pygame.Vector2(0,0)   # direction in tiles (dx,dy)
-        self.next_dir = pygame.Vector2(0,0)
+        self.px, self.py = tile_center(start_tile)   # pixel position
+        self.dx = self.dy = 0     # direction in tiles
+        self.ndx = self.ndy = 0   # requested direction, applied when the turn is free
         self.radius = TILE//2 - 1
         self.lives = 3
         self.score = 0
@@ -183,152 +300,189 @@ class Player:
 
     def update(self, dt):
         # dt in seconds, movement in pixels
-        # convert directions to (dr,dc)
-        if self.next_dir.length_squared() > 0:
+        r,c = self.tile
+        if self.ndx or self.ndy:
             # attempt to turn if possible (tile-aligned turns)
-            nd = (int(self.next_dir.y), int(self.next_dir.x))
             # check if next tile is free
-            r,c = self.tile
-            tr,tc = r + nd[0], c + nd[1]
-            if in_bounds(tr,tc) and not is_wall(MAP[tr][tc]):
-                self.dir = self.next_dir
+            tr,tc = r + self.ndy, c + self.ndx
+            if 0 <= tr < ROWS and 0 <= tc < COLS and MAP_BYTES[tr*COLS+tc] != WALL_CH:
+                self.dx, self.dy = self.ndx, self.ndy
 
         # attempt to move
         move_pixels = PLAYER_SPEED * TILE * dt
-        if self.dir.length_squared() == 0:
+        if not (self.dx or self.dy):
             return
 
         # compute desired pixel target
-        dir_tile = (int(self.dir.y), int(self.dir.x))
-        target_tile = (self.tile[0] + dir_tile[0], self.tile[1] + dir_tile[1])
-        if not in_bounds(*target_tile) or is_wall(MAP[target_tile[0]][target_tile[1]]):
+        tr,tc = r + self.dy, c + self.dx
+        if not (0 <= tr < ROWS and 0 <= tc < COLS) or MAP_BYTES[tr*COLS+tc] == WALL_CH:
             # blocked, stop
             return
 
-        target_pos = pygame.Vector2(tile_center(target_tile))
-        # move towards target_pos
-        to_target = target_pos - self.pos
-        dist = to_target.length()
-        if dist <= move_pixels:
-            # snap to target tile
-            self.pos = target_pos
-            self.tile = target_tile
-        else:
-            self.pos += to_target.normalize() * move_pixels
+        # move towards the target tile's center
+        self.px, self.py, arrived = step_entity(self.px, self.py, TILE_CENTER_X[tc], TILE_CENTER_Y[tr], move_pixels)
+        if arrived:
+            self.tile = (tr,tc)
 
     def draw(self, surf):
-        x,y = int(self.pos.x), int(self.pos.y)
-        # Pac-Man mouth animation based on time
-        t = pygame.time.get_ticks() / 150.0
-        mouth = 0.25 + 0.25 * math.sin(t)
-        # direction angle
-        if self.dir.length_squared() > 0:
-            ang = math.degrees(math.atan2(-self.dir.y, self.dir.x))
-        else:
-            ang = 0
-        # draw circle and mouth triangle
-        pygame.draw.circle(surf, PLAYER_COLOR, (x,y), self.radius)
-        a = math.radians(ang)
-        a1 = a - mouth * math.pi
-        a2 = a + mouth * math.pi
-        p1 = (x + int(math.cos(a1)*self.radius), y + int(math.sin(a1)*self.radius))
-        p2 = (x + int(math.cos(a2)*self.radius), y + int(math.sin(a2)*self.radius))
-        pygame.draw.polygon(surf, BLACK, [(x,y), p1, p2])
+        x,y = int(self.px), int(self.py)
+        # Pac-Man mouth animation based on time, quantized to the prerendered phases
+        phase = int(pygame.time.get_ticks() / MOUTH_PHASE_MS) % MOUTH_PHASES
+        # facing right when standing still
+        dir_idx = DIR_INDEX.get((self.dy, self.dx), DIR_RIGHT)
+        surf.blit(PLAYER_FRAMES[dir_idx][phase], (x - TILE//2, y - TILE//2))
 
 class Ghost:
+    __slots__ = ('name', 'tile', 'px', 'py', 'radius', 'color', 'mode', 'scatter_target', 'target',
+                 'next_tile', 'speed', 'fright_until', 'frt_timer', 'frt_target')
+
     def __init__(self, name, start_tile, scatter_target):
         self.name = name
         self.tile = start_tile
-        self.pos = pygame.Vector2(tile_center(start_tile))
+        self.px, self.py = tile_center(start_tile)
         self.radius = TILE//2 - 1
         self.color = GHOST_COLORS.get(name, (200,100,200))
         self.mode = "scatter"  # scatter, chase, frightened, eaten
         self.scatter_target = scatter_target
         self.target = scatter_target
-        self.path = []
-        self.path_index = 0
+        self.next_tile = None   # tile we're currently moving into
         self.speed = GHOST_SPEED
-        self.fright_timer = 0.0
+        self.fright_until = 0.0 # clock time the current fright ends
+        self.frt_timer = 0.0    # time left before picking a new wander target
+        self.frt_target = None  # current wander target while frightened
 
-    def set_fright(self):
+    def set_fright(self, now):
         if self.mode != "eaten":
             self.mode = "frightened"
-            self.fright_timer = POWER_DURATION
+            self.fright_until = now + POWER_DURATION
+            self.frt_timer = 0.0
+
+    def set_eaten(self):
+        self.mode = "eaten"
+        self.fright_until = 0.0
+
+    def tick_mode(self, now, cycle):
+        # the only place a ghost's mode changes over time; priority is
+        # eaten (until back home) > frightened (until fright_until) > scatter/chase
+        if self.mode == "eaten" and self.tile != GHOST_HOME:
+            return
+        if now < self.fright_until:
+            mode = "frightened"
+        else:
+            mode = "scatter" if cycle == 0 else "chase"
+        if mode != self.mode:
+            self.mode = mode
 
     def update(self, dt, player_tile, player_pos, grid):
-        # Mode handling
-        if self.mode == "frightened":
-            self.fright_timer -= dt
-            if self.fright_timer <= 0:
-                self.mode = "chase"
         # Decide target tile
         if self.mode == "scatter":
             self.target = self.scatter_target
         elif self.mode == "chase":
             self.target = player_tile
         elif self.mode == "frightened":
-            # random wander target
-            self.target = random.choice([ (random.randint(0,ROWS-1), random.randint(0,COLS-1)) ])
+            # random wander target, kept until reached or FRIGHT_RETARGET runs out
+            self.frt_timer -= dt
+            if self.frt_timer <= 0 or self.frt_target is None or self.tile == self.frt_target:
+                self.frt_target = WALKABLE[random.randrange(len(WALKABLE))]
+                self.frt_timer = FRIGHT_RETARGET
+            self.target = self.frt_target
         elif self.mode == "eaten":
-            # go to ghost box (home) - use scatter_target as home entrance
-            self.target = (13,13)
+            # go to ghost box (home)
+            self.target = GHOST_HOME
 
-        # Recompute path occasionally or if finished
-        recalc = False
-        if not self.path or self.path_index >= len(self.path):
-            recalc = True
-        else:
-            # if target changed tile, recalc
-            if self.path and self.path[-1] != self.target:
-                recalc = True
-
-        if recalc:
-            start = (int(round(self.pos.y / TILE)), int(round(self.pos.x / TILE)))
-            p = bfs(start, self.target)
-            if p:
-                self.path = p
-                # path[0] is start tile, we want to step to next tile
-                self.path_index = 1 if len(p) > 1 else 0
+        # pick the next tile on the shortest path once the previous step is done
+        if self.next_tile is None:
+            self.next_tile = next_step(self.tile, self.target)
 
         # move along path
         move_pixels = (FRIGHT_SPEED if self.mode == "frightened" else self.speed) * TILE * dt
-        if self.path and self.path_index < len(self.path):
-            next_tile = self.path[self.path_index]
-            target_pos = pygame.Vector2(tile_center(next_tile))
-            to_target = target_pos - self.pos
-            dist = to_target.length()
-            if dist <= move_pixels or dist == 0:
-                # snap to tile
-                self.pos = target_pos
+        next_tile = self.next_tile
+        if next_tile is not None:
+            tx, ty = TILE_CENTER_X[next_tile[1]], TILE_CENTER_Y[next_tile[0]]
+            self.px, self.py, arrived = step_entity(self.px, self.py, tx, ty, move_pixels)
+            if arrived:
                 self.tile = next_tile
-                self.path_index += 1
-            else:
-                self.pos += to_target.normalize() * move_pixels
+                self.next_tile = None
 
     def draw(self, surf):
-        x,y = int(self.pos.x), int(self.pos.y)
-        if self.mode == "frightened":
-            # blue frightened ghost
-            body_col = (50,50,255)
-        elif self.mode == "eaten":
-            # eyes only (draw white eyes)
-            pygame.draw.circle(surf, (255,255,255), (x-6,y-4), 3)
-            pygame.draw.circle(surf, (255,255,255), (x+6,y-4), 3)
-            pygame.draw.circle(surf, (0,0,0), (x-6,y-4), 1)
-            pygame.draw.circle(surf, (0,0,0), (x+6,y-4), 1)
-            return
+        x,y = int(self.px), int(self.py)
+        if self.mode == "eaten":
+            sprite = GHOST_EYES
+        elif self.mode == "frightened":
+            sprite = GHOST_FRAMES[(self.name, "frightened")]
         else:
-            body_col = self.color
-
-        # simple ghost body (circle + rectangle)
-        pygame.draw.rect(surf, body_col, (x-self.radius, y-self.radius+4, self.radius*2, self.radius+6))
-        pygame.draw.circle(surf, body_col, (x-self.radius+6, y-self.radius+4), self.radius)
-        pygame.draw.circle(surf, body_col, (x+self.radius-6, y-self.radius+4), self.radius)
-        # eyes
-        pygame.draw.circle(surf, (255,255,255), (x-6, y-2), 3)
-        pygame.draw.circle(surf, (255,255,255), (x+6, y-2), 3)
-        pygame.draw.circle(surf, (0,0,255), (x-6+ (1 if self.mode!='frightened' else 0), y-2), 1)
-        pygame.draw.circle(surf, (0,0,255), (x+6+ (1 if self.mode!='frightened' else 0), y-2), 1)
+            sprite = GHOST_FRAMES[(self.name, "normal")]
+        surf.blit(sprite, (x - GHOST_SPRITE_SIZE//2, y - GHOST_SPRITE_SIZE//2))
+
+# --- Sprites ---
+# Player and ghosts are rendered once into small surfaces; draw() just blits them.
+MOUTH_PHASES = 16
+MOUTH_PHASE_MS = 150.0 * 2*math.pi / MOUTH_PHASES   # one open/close cycle every 2*pi*150 ms
+DIR_INDEX = {d: i for i, d in enumerate(DIRS)}   # (dr,dc) -> index into DIRS
+DIR_RIGHT = DIR_INDEX[(0,1)]
+GHOST_SPRITE_SIZE = TILE * 2   # ghost body and eyes overhang their tile
+# Sprites use a colorkey instead of per-pixel alpha: the shapes are drawn without
+# antialiasing, and colorkey blits are cheaper than alpha blending. Black is part
+# of the sprites (mouth, pupils), so the key is a colour nothing uses.
+SPRITE_KEY = (255, 0, 255)
+
+def sprite_surface(size):
+    surf = pygame.Surface((size, size))
+    surf.fill(SPRITE_KEY)
+    surf.set_colorkey(SPRITE_KEY, pygame.RLEACCEL)
+    return surf
+
+def render_player(dir_idx, phase):
+    size = TILE
+    x = y = size // 2
+    radius = TILE//2 - 1
+    surf = sprite_surface(size)
+    mouth = 0.25 + 0.25 * math.sin(phase * 2*math.pi / MOUTH_PHASES)
+    dr, dc = DIRS[dir_idx]
+    # draw circle and mouth triangle
+    pygame.draw.circle(surf, PLAYER_COLOR, (x,y), radius)
+    a = math.atan2(-dr, dc)
+    a1 = a - mouth * math.pi
+    a2 = a + mouth * math.pi
+    p1 = (x + int(math.cos(a1)*radius), y + int(math.sin(a1)*radius))
+    p2 = (x + int(math.cos(a2)*radius), y + int(math.sin(a2)*radius))
+    pygame.draw.polygon(surf, BLACK, [(x,y), p1, p2])
+    return surf.convert()
+
+def render_ghost(body_col, frightened):
+    size = GHOST_SPRITE_SIZE
+    x = y = size // 2
+    radius = TILE//2 - 1
+    surf = sprite_surface(size)
+    # simple ghost body (circle + rectangle)
+    pygame.draw.rect(surf, body_col, (x-radius, y-radius+4, radius*2, radius+6))
+    pygame.draw.circle(surf, body_col, (x-radius+6, y-radius+4), radius)
+    pygame.draw.circle(surf, body_col, (x+radius-6, y-radius+4), radius)
+    # eyes
+    pygame.draw.circle(surf, (255,255,255), (x-6, y-2), 3)
+    pygame.draw.circle(surf, (255,255,255), (x+6, y-2), 3)
+    pygame.draw.circle(surf, (0,0,255), (x-6+ (0 if frightened else 1), y-2), 1)
+    pygame.draw.circle(surf, (0,0,255), (x+6+ (0 if frightened else 1), y-2), 1)
+    return surf.convert()
+
+def render_ghost_eyes():
+    size = GHOST_SPRITE_SIZE
+    x = y = size // 2
+    surf = sprite_surface(size)
+    # eyes only (draw white eyes)
+    pygame.draw.circle(surf, (255,255,255), (x-6,y-4), 3)
+    pygame.draw.circle(surf, (255,255,255), (x+6,y-4), 3)
+    pygame.draw.circle(surf, (0,0,0), (x-6,y-4), 1)
+    pygame.draw.circle(surf, (0,0,0), (x+6,y-4), 1)
+    return surf.convert()
+
+def render_dot(radius, color):
+    surf = sprite_surface(radius * 2)
+    pygame.draw.circle(surf, color, (radius, radius), radius)
+    return surf.convert()
+
+# player/ghost touch distance, squared (both radii are TILE//2 - 1)
+COLLIDE_R2 = ((TILE//2 - 1) + (TILE//2 - 1) - 3) ** 2
 
 # --- Game init ---
 pygame.init()
@@ -338,12 +492,28 @@ pygame.display.set_caption("Pac-Man")
 clock = pygame.time.Clock()
 font = pygame.font.SysFont("arial", 18)
 bigfont = pygame.font.SysFont("arial", 36, bold=True)
+# static maze: walls are drawn once here and blitted each frame
+MAZE_SURF = pygame.Surface((WIDTH, HEIGHT))
+MAZE_SURF.fill(BLACK)
+for r,row in enumerate(MAP):
+    for c,ch in enumerate(row):
+        if ch == '#':
+            x = c * TILE
+            y = r * TILE
+            # draw wall block (outline to look maze-ish)
+            pygame.draw.rect(MAZE_SURF, WALL_BLUE, (x, y, TILE, TILE))
+            pygame.draw.rect(MAZE_SURF, (0,0,0), (x+2, y+2, TILE-4, TILE-4))
+MAZE_SURF = MAZE_SURF.convert()
+
 dot_eat = pygame.mixer.Sound("./dot_eat.mp3")
 dot_eat.set_volume(.2)
+# reserved channel for the chomp so pickups don't grab a new voice each time
+pygame.mixer.set_reserved(1)
+dot_channel = pygame.mixer.Channel(0)
 
 pygame.mixer.music.load("./ghosts_noises.wav")
 pygame.mixer.music.set_volume(0.2)
-pygame.mixer.music.play(-1)
+pygame.mixer.music.play(-1)   # started once, keeps looping across restarts
 
 # create player and ghosts
 player = Player(player_start)
@@ -354,15 +524,34 @@ ghosts = [
     Ghost("clyde", ghost_starts.get('4', (13,15)), (ROWS-1,1)),       # bottom-left scatter
 ]
 
-# initial pellets: ensure pellets exist where map has '.'
-# (we already collected pellets and power_pellets sets earlier)
-pellets_active = set(pellets)
-power_active = set(power_pellets)
+# prerender sprites (needs the display mode set for convert)
+PLAYER_FRAMES = [[render_player(d, phase) for phase in range(MOUTH_PHASES)] for d in range(len(DIRS))]
+FRIGHT_GHOST = render_ghost((50,50,255), True)   # blue frightened ghost
+GHOST_FRAMES = {}
+for g in ghosts:
+    GHOST_FRAMES[(g.name, "normal")] = render_ghost(g.color, False)
+    GHOST_FRAMES[(g.name, "frightened")] = FRIGHT_GHOST
+GHOST_EYES = render_ghost_eyes()
+
+# pellet dots, with one (surface, position) blit per pellet in PELLET_COORDS /
+# POWER_COORDS order; the draw loop hands the active ones to screen.blits
+PELLET_SURF = render_dot(2, PELLET_COLOR)
+POWER_SURF = render_dot(5, POWER_COLOR)
+PELLET_BLITS = [(PELLET_SURF, (TILE_CENTER_X[c] - 2, TILE_CENTER_Y[r] - 2)) for r,c in PELLET_COORDS]
+POWER_BLITS = [(POWER_SURF, (TILE_CENTER_X[c] - 5, TILE_CENTER_Y[r] - 5)) for r,c in POWER_COORDS]
+PELLET_IDX = np.nonzero(PELLET_MASK0)   # same row-major order as PELLET_COORDS
+POWER_IDX = np.nonzero(POWER_MASK0)
+
+# active pellets: boolean masks indexed [r,c], reset from the initial masks
+pellets_active = PELLET_MASK0.copy()
+power_active = POWER_MASK0.copy()
 
 game_state = "ready"  # ready, playing, gameover
 ready_timer = 2.0
 power_timer = 0.0
-ghost_frightened_until = 0.0
+mode_clock = 0.0   # seconds of play, drives the scatter/chase cycle
+MODE_PERIOD = 7.0  # seconds per scatter/chase phase
+accum = 0.0        # frame time not yet simulated, in seconds
 
 last_time = time.time()
 
@@ -389,24 +578,27 @@ while running:
                 if ev.key == pygame.K_r:
                     # restart full game
                     player = Player(player_start)
-                    pellets_active = set(pellets)
-                    power_active = set(power_pellets)
-                    for g, name in zip(ghosts, ["blinky","pinky","inky","clyde"]):
-                        g.tile = ghost_starts.get(str(["1","2","3","4"].index(name)+1), g.tile)
-                        g.pos = pygame.Vector2(tile_center(g.tile))
+                    np.copyto(pellets_active, PELLET_MASK0)
+                    np.copyto(power_active, POWER_MASK0)
+                    mode_clock = 0.0
+                    for g, key in zip(ghosts, "1234"):
+                        g.tile = ghost_starts.get(key, g.tile)
+                        g.px, g.py = tile_center(g.tile)
+                        g.next_tile = None
                         g.mode = "scatter"
+                        g.fright_until = 0.0
                     game_state = "ready"
                     ready_timer = 2.0
             else:
                 # player direction controls (tile-based)
                 if ev.key == pygame.K_LEFT:
-                    player.next_dir = pygame.Vector2(-1,0)
+                    player.ndx, player.ndy = -1, 0
                 elif ev.key == pygame.K_RIGHT:
-                    player.next_dir = pygame.Vector2(1,0)
+                    player.ndx, player.ndy = 1, 0
                 elif ev.key == pygame.K_UP:
-                    player.next_dir = pygame.Vector2(0,-1)
+                    player.ndx, player.ndy = 0, -1
                 elif ev.key == pygame.K_DOWN:
-                    player.next_dir = pygame.Vector2(0,1)
+                    player.ndx, player.ndy = 0, 1
                 elif ev.key == pygame.K_r and game_state == "ready":
                     # start playing
                     game_state = "playing"
@@ -417,90 +609,85 @@ while running:
         if ready_timer <= 0:
             game_state = "playing"
     elif game_state == "playing":
-        # update player
-        player.update(dt)
-        # pellet pickup
-        ptile = (int(player.tile[0]), int(player.tile[1]))
-        if ptile in pellets_active:
-            pellets_active.remove(ptile)
-            dot_eat.play()
-            player.score += 10
-        if ptile in power_active:
-            power_active.remove(ptile)
-            player.score += 50
-            # set ghosts frightened
-            for g in ghosts:
-                g.set_fright()
-            ghost_frightened_until = time.time() + POWER_DURATION
-
-        # update ghosts
-        for g in ghosts:
-            # if frightened time expired
-            if time.time() > ghost_frightened_until and g.mode == "frightened":
-                g.mode = "chase"
+        # one clock read per frame, shared by everything below
+        now = time.monotonic()
+        # advance the simulation in fixed DT_FIXED steps so a slow frame can't
+        # move anything more than a fraction of a tile at once
+        accum += min(dt, MAX_FRAME_DT)
+        while accum >= DT_FIXED and game_state == "playing":
+            accum -= DT_FIXED
+            mode_clock += DT_FIXED
             # simple mode toggling between scatter and chase every 7 seconds (basic)
-            cycle = int(time.time() // 7) % 2
-            if g.mode not in ("frightened","eaten"):
-                g.mode = "scatter" if cycle == 0 else "chase"
-            # update with pathfinding
-            g.update(dt, player.tile, player.pos, MAP)
-
-        # check collisions: player vs ghost
-        for g in ghosts:
-            dist = (g.pos - player.pos).length()
-            if dist < (g.radius + player.radius - 3):
-                # collision
-                if g.mode == "frightened":
-                    # eat ghost
-                    g.mode = "eaten"
-                    player.score += 200
-                    # send to home
-                    g.path = []
-                    g.path_index = 0
-                elif g.mode != "eaten":
-                    # player dies
-                    player.lives -= 1
-                    if player.lives <= 0:
-                        game_state = "gameover"
-                    else:
-                        # reset positions to start
-                        player.pos = pygame.Vector2(tile_center(player_start))
-                        player.tile = player_start
-                        player.dir = pygame.Vector2(0,0)
-                        for gh in ghosts:
-                            gh.pos = pygame.Vector2(tile_center(gh.tile))
-                            gh.path = []
-                            gh.mode = "scatter"
-                        game_state = "ready"
-                        ready_timer = 1.5
-                    break
-
-        # win condition (no pellets)
-        if not pellets_active and not power_active:
-            # simple win: reset pellets and continue
-            pellets_active = set(pellets)
-            power_active = set(power_pellets)
+            cycle = int(mode_clock // MODE_PERIOD) % 2
+            # update player
+            player.update(DT_FIXED)
+            # pellet pickup
+            ptile = (int(player.tile[0]), int(player.tile[1]))
+            if pellets_active[ptile]:
+                pellets_active[ptile] = False
+                if not dot_channel.get_busy():
+                    dot_channel.play(dot_eat)
+                player.score += 10
+            if power_active[ptile]:
+                power_active[ptile] = False
+                player.score += 50
+                # set ghosts frightened
+                for g in ghosts:
+                    g.set_fright(now)
+
+            # update ghosts
+            for g in ghosts:
+                g.tick_mode(now, cycle)
+                # update with pathfinding
+                g.update(DT_FIXED, player.tile, (player.px, player.py), MAP)
+
+            # check collisions: player vs ghost
+            for g in ghosts:
+                ddx = g.px - player.px
+                ddy = g.py - player.py
+                if ddx*ddx + ddy*ddy < COLLIDE_R2:
+                    # collision
+                    if g.mode == "frightened":
+                        # eat ghost
+                        g.set_eaten()
+                        player.score += 200
+                        # send to home
+                        g.next_tile = None
+                    elif g.mode != "eaten":
+                        # player dies
+                        player.lives -= 1
+                        if player.lives <= 0:
+                            game_state = "gameover"
+                        else:
+                            # reset positions to start
+                            player.px, player.py = tile_center(player_start)
+                            player.tile = player_start
+                            player.dx = player.dy = 0
+                            for gh in ghosts:
+                                gh.px, gh.py = tile_center(gh.tile)
+                                gh.next_tile = None
+                                gh.mode = "scatter"
+                                gh.fright_until = 0.0
+                            game_state = "ready"
+                            ready_timer = 1.5
+                        break
+
+            # win condition (no pellets)
+            if not pellets_active.any() and not power_active.any():
+                # simple win: reset pellets and continue
+                np.copyto(pellets_active, PELLET_MASK0)
+                np.copyto(power_active, POWER_MASK0)
+        if game_state != "playing":
+            # don't carry leftover sim time into the next life/game
+            accum = 0.0
 
     # --- Drawing ---
-    screen.fill(BLACK)
+    # maze walls (also clears the previous frame)
+    screen.blit(MAZE_SURF, (0,0))
 
-    # draw maze walls and pellets
-    for r,row in enumerate(MAP):
-        for c,ch in enumerate(row):
-            x = c * TILE
-            y = r * TILE
-            if ch == '#':
-                # draw wall block (outline to look maze-ish)
-                pygame.draw.rect(screen, WALL_BLUE, (x, y, TILE, TILE))
-                pygame.draw.rect(screen, (0,0,0), (x+2, y+2, TILE-4, TILE-4))
-            else:
-                # floor; draw pellet if active
-                if (r,c) in pellets_active:
-                    cx,cy = tile_center((r,c))
-                    pygame.draw.circle(screen, PELLET_COLOR, (cx,cy), 2)
-                if (r,c) in power_active:
-                    cx,cy = tile_center((r,c))
-                    pygame.draw.circle(screen, POWER_COLOR, (cx,cy), 5)
+    # draw active pellets
+    screen.blits(compress(PELLET_BLITS, pellets_active[PELLET_IDX].tolist()), doreturn=False)
+    screen.blits(compress(POWER_BLITS, power_active[POWER_IDX].tolist()), doreturn=False)
 
     # draw ghosts
     for g in ghosts:
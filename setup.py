@@ -0,0 +1,10 @@
+# Builds the optional _pac_core extension next to game.py:
+#   python3 setup.py build_ext --inplace
+# game.py runs without it (pure Python / numba fallbacks).
+from setuptools import setup
+from Cython.Build import cythonize
+
+setup(
+    name="pac-man-core",
+    ext_modules=cythonize(["_pac_core.pyx"]),
+)